@@ -6,6 +6,8 @@ __version__ = "0.4.0"
 
 
 class Signal:
+    __slots__ = ("name", "receivers", "__weakref__")
+
     def __init__(self, name: str = None) -> None:
         self.name: Optional[str] = name
         self.receivers: List[Callable] = []
@@ -18,12 +20,8 @@ class Signal:
         return fn
 
     def send(self, *recv_args, **recv_kwargs) -> Set[asyncio.Task]:
-        tasks = set()
-        for recv in self.receivers:
-            coro = recv(*recv_args, **recv_kwargs)
-            task = asyncio.create_task(coro)
-            tasks.add(task)
-        return tasks
+        create_task = asyncio.create_task
+        return {create_task(recv(*recv_args, **recv_kwargs)) for recv in self.receivers}
 
     async def join(self, *args, **kwargs) -> List:
         tasks = self.send(*args, **kwargs)
@@ -34,6 +32,8 @@ class Signal:
 
 
 class Namespace:
+    __slots__ = ("signals", "__weakref__")
+
     def __init__(self) -> None:
         self.signals = {}
 
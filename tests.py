@@ -1,4 +1,6 @@
 import asyncio
+import weakref
+
 import accordian
 import pytest
 
@@ -39,6 +41,14 @@ def test_new_signal():
     assert x.receivers == anon.receivers == []
 
 
+def test_weakref():
+    """Signals and namespaces can be weakly referenced"""
+    sig = accordian.Signal()
+    ns = accordian.Namespace()
+    assert weakref.ref(sig)() is sig
+    assert weakref.ref(ns)() is ns
+
+
 def test_connect_regular_fn(sig):
     """Signal.connect only accepts coroutine (async def) functions"""
     def regular():